@@ -10,16 +10,33 @@ Provides tools for analyzing your Plex library including:
 import os
 import sys
 import argparse
+import platform
+import bisect
 import logging
 import json
+import functools
+import threading
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Set
 from pathlib import Path
 from dotenv import load_dotenv
 from datetime import datetime
+from itertools import groupby
+from operator import itemgetter
 
+import psutil
 from plexapi.server import PlexServer
 from plexapi.video import Movie, Episode
 
+# GPUtil is optional. It is imported here rather than in the system info
+# collectors, because first-time imports from concurrent worker threads can
+# deadlock on the import lock.
+try:
+    import GPUtil
+except ImportError:
+    GPUtil = None
+
 # Load environment variables
 load_dotenv()
 
@@ -30,6 +47,157 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Plex metadata type numbers for the leaf items of each library type
+LEAF_TYPES = {'movie': 1, 'show': 4, 'artist': 10}
+
+# Number of items requested per page when listing a library section
+PAGE_SIZE = 200
+
+# Listing fields and tag elements left out when only the media details
+# (or just the rating keys) of the listed items are used
+LEAN_EXCLUDE_FIELDS = 'summary,tagline,thumb,art,theme,parentThumb,grandparentThumb,grandparentArt,grandparentTheme'
+LEAN_EXCLUDE_ELEMENTS = 'Genre,Country,Director,Writer,Producer,Role,Collection,Label,Guid,Rating,Similar,Style,Mood,Format'
+
+# Number of items fetched per /library/metadata/<keys> request
+METADATA_BATCH_SIZE = 50
+
+# Worker threads used for per-item metadata access (I/O bound)
+MAX_WORKERS = 8
+
+# XML includes skipped when an item is reloaded only for its media streams
+LEAN_RELOAD = {
+    'includeBandwidths': False,
+    'includeChapters': False,
+    'includeFields': False,
+    'includeGeolocation': False,
+    'includeLoudnessRamps': False,
+    'includeMarkers': False,
+}
+
+# ISO 639-2 to ISO 639-1 codes for common subtitle languages; other
+# three-letter codes are truncated to their first two letters
+LANG3_TO_2 = {'eng': 'en', 'spa': 'es', 'fra': 'fr', 'deu': 'de', 'ita': 'it', 'por': 'pt'}
+
+# Number of results kept per memoized item accessor
+ITEM_CACHE_SIZE = 4096
+
+
+def cache_by_item(func):
+    """
+    Memoize a per-item accessor on the item's (ratingKey, updatedAt).
+
+    Results are kept in a thread-safe LRU of ITEM_CACHE_SIZE entries on the
+    PlexTools instance, so analyzers walking overlapping items reuse the
+    earlier results, and an item edited on the server gets a new updatedAt
+    and is looked up again. Only use it for data that editing the item
+    changes; playing an item does not bump updatedAt.
+    """
+    @functools.wraps(func)
+    def wrapper(self, item):
+        key = (item.ratingKey, getattr(item, 'updatedAt', None))
+        with self._item_cache_lock:
+            cache = self._item_caches.setdefault(func.__name__, OrderedDict())
+            if key in cache:
+                cache.move_to_end(key)
+                return cache[key]
+
+        result = func(self, item)
+
+        with self._item_cache_lock:
+            cache[key] = result
+            if len(cache) > ITEM_CACHE_SIZE:
+                cache.popitem(last=False)
+        return result
+
+    return wrapper
+
+
+BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+
+def format_bytes(bytes_value) -> str:
+    """Convert bytes to human readable format."""
+    # Each unit is 2**10 times the previous one, so the unit index can be
+    # read from the bit length instead of dividing in a loop
+    unit = 0
+    if bytes_value >= 1024:
+        unit = min(len(BYTE_UNITS) - 1, (int(bytes_value).bit_length() - 1) // 10)
+    return f"{bytes_value / (1 << (10 * unit)):.2f} {BYTE_UNITS[unit]}"
+
+
+def imap_bounded(executor, func, items, window: int = MAX_WORKERS * 4):
+    """
+    Map func over items on an executor, yielding results in order.
+
+    Unlike executor.map, which submits every item up front, at most
+    `window` items are in flight at a time, so results can be streamed
+    from a lazily produced iterable.
+    """
+    pending = deque()
+    for item in items:
+        pending.append(executor.submit(func, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def format_datetime(value: datetime) -> str:
+    """Format a datetime as 'YYYY-MM-DD HH:MM:SS'."""
+    return value.isoformat(sep=' ', timespec='seconds')
+
+
+# Minimum heights for each resolution label, in ascending order
+_RES_THRESHOLDS = (0, 720, 1080, 2160)
+_RES_LABELS = ('SD', '720p', '1080p', '4K')
+
+
+def _media_resolution(media) -> str:
+    """Return the resolution label of a Media object."""
+    if media.videoResolution:
+        return media.videoResolution
+    if media.width and media.height:
+        return _RES_LABELS[bisect.bisect_right(_RES_THRESHOLDS, max(media.height, 0)) - 1]
+    return 'Unknown'
+
+
+def _first_part(item):
+    """Return the first media part of an item, or None if it has none."""
+    media = item.media
+    parts = media[0].parts if media else None
+    return parts[0] if parts else None
+
+
+def _format_item(item: dict, indent: int, append, show_last_viewed: bool = False):
+    """Append the detail lines of a library report entry, indented by `indent`."""
+    pad = ' ' * indent
+    append(f"{pad}Rating Key: {item['rating_key']}\n")
+    append(f"{pad}File Path: {item['filepath']}\n")
+    append(f"{pad}URL: {item['url']}\n")
+    append(f"{pad}File Size: {item['filesize']}\n")
+    append(f"{pad}Quality: {item['resolution']} | Video: {item['video_codec']} | Audio: {item['audio_codec']}\n")
+    append(f"{pad}Watched: {'✓ Yes' if item['watched'] else '✗ No'} (Views: {item['view_count']})\n")
+    if show_last_viewed and item['last_viewed']:
+        append(f"{pad}Last Viewed: {format_datetime(item['last_viewed'])}\n")
+
+    if not item['has_subtitles']:
+        append(f"{pad}Subtitles: NO\n")
+        return
+
+    languages = item['languages']
+    append(f"{pad}Subtitles: YES\n")
+    append(f"{pad}Languages: {', '.join(dict.fromkeys(languages)).upper() if languages else 'Unknown'}\n")
+    append(f"{pad}Streams:\n")
+    bullet = pad + "  • "
+    for stream in item['subtitle_streams']:
+        parts = [bullet, stream['language'], " (", stream['language_code'].upper(), ") - ", str(stream['format'])]
+        if stream['title']:
+            parts += (" - ", stream['title'])
+        if stream['forced']:
+            parts.append(" [FORCED]")
+        parts.append(" [EXTERNAL]\n" if stream['external'] else " [EMBEDDED]\n")
+        append(''.join(parts))
+
 
 class PlexTools:
     """Tools for analyzing Plex libraries."""
@@ -44,57 +212,195 @@ class PlexTools:
         """
         self.plex = PlexServer(plex_url, plex_token)
 
+        # Library sections rarely change during a run, so look them up once
+        self._sections = None
+        self._section_cache = {}
+
+        # Per-accessor item caches used by cache_by_item
+        self._item_caches = {}
+        self._item_cache_lock = threading.Lock()
+
         logger.info(f"Connected to Plex server: {self.plex.friendlyName}")
 
-    def get_system_info(self):
-        """Get comprehensive system information about the Plex server."""
-        import platform
-        import psutil
-        from datetime import datetime
+    def get_sections(self) -> list:
+        """Get all library sections, fetching them from the server only once."""
+        if self._sections is None:
+            self._sections = self.plex.library.sections()
+            for section in self._sections:
+                self._section_cache.setdefault(section.title, section)
+        return self._sections
+
+    def get_section(self, library_name: str):
+        """Get a library section by name, fetching it from the server only once."""
+        section = self._section_cache.get(library_name)
+        if section is None:
+            section = self.plex.library.section(library_name)
+            self._section_cache[library_name] = section
+        return section
+
+    def _iter_section(self, section, type_num: int = None, page: int = PAGE_SIZE, lean: bool = False):
+        """
+        Iterate over the items of a library section one page at a time.
+
+        Episodes and tracks are requested directly from the section instead of
+        walking each show or artist, and items are yielded as each page is
+        parsed so large libraries are never held in memory as a single list.
 
+        Args:
+            section: Plex library section
+            type_num: Plex metadata type (1 = movie, 4 = episode, 10 = track).
+                Defaults to the section's own type.
+            page: Number of items to request per page
+            lean: Leave summaries, artwork and tags out of the listing, for
+                callers that only read media details or rating keys
+
+        Yields:
+            Library items
+        """
+        key = f'/library/sections/{section.key}/all?includeCollections=0'
+        if type_num is not None:
+            key += f'&type={type_num}'
+        if lean:
+            key += f'&excludeFields={LEAN_EXCLUDE_FIELDS}&excludeElements={LEAN_EXCLUDE_ELEMENTS}'
+
+        start = 0
+        while True:
+            data = self.plex.query(f'{key}&X-Plex-Container-Start={start}&X-Plex-Container-Size={page}')
+            for item in self.plex.findItems(data, initpath=key):
+                # Attributes missing from the listing are genuinely empty, so
+                # don't let plexapi reload the whole item when one is accessed
+                item._autoReload = False
+                yield item
+            if len(data) < page:
+                break
+            start += page
+
+    def _iter_full_items(self, items, batch_size: int = METADATA_BATCH_SIZE):
+        """
+        Replace listing items with their full metadata, fetched in batches.
+
+        Listing items lack details such as media streams, so accessing them
+        costs one request per item. Fetching /library/metadata/<keys> for a
+        batch of rating keys loads the full items in a single request.
+
+        Args:
+            items: Iterable of listing items
+            batch_size: Number of items per request
+
+        Yields:
+            Full items, in the order of the listing items
+        """
+        batch = []
+        for item in items:
+            batch.append(item)
+            if len(batch) == batch_size:
+                yield from self._fetch_full_batch(batch)
+                batch = []
+        if batch:
+            yield from self._fetch_full_batch(batch)
+
+    def _fetch_full_batch(self, batch: list) -> list:
+        """Fetch the full metadata for one batch of listing items."""
+        key = '/library/metadata/' + ','.join(str(item.ratingKey) for item in batch)
+        full_items = {}
+        for full_item in self.plex.fetchItems(key):
+            full_item._autoReload = False
+            # Loaded from a batch key, so plexapi would consider it partial
+            full_item._fullMetadata = True
+            full_items[full_item.ratingKey] = full_item
+
+        # Fall back to the listing item if the server didn't return it
+        return [full_items.get(item.ratingKey, item) for item in batch]
+
+    def get_system_info(self, include_library_stats: bool = True):
+        """
+        Get comprehensive system information about the Plex server.
+
+        Args:
+            include_library_stats: Also collect the item count and total size
+                of every library
+
+        Returns:
+            Dictionary of system information
+        """
+        # The collectors are independent, so run them concurrently: the
+        # one-second CPU sample overlaps with the library enumeration
+        collectors = []
+        if include_library_stats:
+            # Slowest collector, so it starts first
+            collectors.append(self._collect_libraries)
+        collectors += [
+            self._collect_platform,
+            self._collect_cpu,
+            self._collect_mem_swap,
+            self._collect_disks,
+            self._collect_net,
+            self._collect_gpu,
+            self._collect_uptime,
+            self._collect_plex_server,
+        ]
+
+        # One worker per collector, so none waits behind another
         system_info = {}
+        with ThreadPoolExecutor(max_workers=len(collectors)) as executor:
+            futures = [executor.submit(collector) for collector in collectors]
+            for future in futures:
+                system_info.update(future.result())
+
+        return system_info
 
-        # Basic system info
-        system_info['hostname'] = platform.node()
-        system_info['os'] = platform.system()
-        system_info['os_version'] = platform.release()
-        system_info['architecture'] = platform.machine()
-        system_info['python_version'] = platform.python_version()
+    def _collect_platform(self) -> dict:
+        """Collect basic information about the local machine."""
+        return {
+            'hostname': platform.node(),
+            'os': platform.system(),
+            'os_version': platform.release(),
+            'architecture': platform.machine(),
+            'python_version': platform.python_version()
+        }
 
-        # CPU Information
-        system_info['cpu_physical_cores'] = psutil.cpu_count(logical=False)
-        system_info['cpu_logical_cores'] = psutil.cpu_count(logical=True)
-        system_info['cpu_usage_percent'] = psutil.cpu_percent(interval=1, percpu=False)
-        system_info['cpu_usage_per_core'] = psutil.cpu_percent(interval=1, percpu=True)
+    def _collect_cpu(self) -> dict:
+        """Collect CPU core counts, usage and frequency."""
+        cpu_info = {}
+        cpu_info['cpu_physical_cores'] = psutil.cpu_count(logical=False)
+        cpu_info['cpu_logical_cores'] = psutil.cpu_count(logical=True)
+        # One blocking sample; the overall usage is the mean across cores
+        per_core = psutil.cpu_percent(interval=1, percpu=True)
+        cpu_info['cpu_usage_per_core'] = per_core
+        cpu_info['cpu_usage_percent'] = sum(per_core) / len(per_core) if per_core else 0.0
 
         try:
             cpu_freq = psutil.cpu_freq()
             if cpu_freq:
-                system_info['cpu_freq_current'] = cpu_freq.current
-                system_info['cpu_freq_min'] = cpu_freq.min
-                system_info['cpu_freq_max'] = cpu_freq.max
-        except:
+                cpu_info['cpu_freq_current'] = cpu_freq.current
+                cpu_info['cpu_freq_min'] = cpu_freq.min
+                cpu_info['cpu_freq_max'] = cpu_freq.max
+        except (AttributeError, NotImplementedError, OSError):
             pass
 
-        # Memory Information
-        memory = psutil.virtual_memory()
-        system_info['memory_total'] = memory.total
-        system_info['memory_available'] = memory.available
-        system_info['memory_used'] = memory.used
-        system_info['memory_percent'] = memory.percent
+        return cpu_info
 
-        # Swap Information
+    def _collect_mem_swap(self) -> dict:
+        """Collect memory and swap usage."""
+        memory = psutil.virtual_memory()
         swap = psutil.swap_memory()
-        system_info['swap_total'] = swap.total
-        system_info['swap_used'] = swap.used
-        system_info['swap_percent'] = swap.percent
+        return {
+            'memory_total': memory.total,
+            'memory_available': memory.available,
+            'memory_used': memory.used,
+            'memory_percent': memory.percent,
+            'swap_total': swap.total,
+            'swap_used': swap.used,
+            'swap_percent': swap.percent
+        }
 
-        # Disk Information
-        system_info['disks'] = []
+    def _collect_disks(self) -> dict:
+        """Collect usage of each mounted disk partition."""
+        disks = []
         for partition in psutil.disk_partitions():
             try:
                 usage = psutil.disk_usage(partition.mountpoint)
-                system_info['disks'].append({
+                disks.append({
                     'device': partition.device,
                     'mountpoint': partition.mountpoint,
                     'fstype': partition.fstype,
@@ -106,8 +412,11 @@ class PlexTools:
             except PermissionError:
                 continue
 
-        # Network Information
-        system_info['network_interfaces'] = {}
+        return {'disks': disks}
+
+    def _collect_net(self) -> dict:
+        """Collect the IPv4 addresses of each network interface."""
+        network_interfaces = {}
         net_if_addrs = psutil.net_if_addrs()
         for interface_name, interface_addresses in net_if_addrs.items():
             addrs = []
@@ -119,15 +428,20 @@ class PlexTools:
                         'netmask': address.netmask
                     })
             if addrs:
-                system_info['network_interfaces'][interface_name] = addrs
+                network_interfaces[interface_name] = addrs
+
+        return {'network_interfaces': network_interfaces}
 
-        # GPU Information (if available)
-        system_info['gpu_info'] = []
+    def _collect_gpu(self) -> dict:
+        """Collect GPU information (if available)."""
+        if GPUtil is None:
+            return {'gpu_info': None}
+
+        gpu_info = []
         try:
-            import GPUtil
             gpus = GPUtil.getGPUs()
             for gpu in gpus:
-                system_info['gpu_info'].append({
+                gpu_info.append({
                     'name': gpu.name,
                     'load': gpu.load * 100,
                     'memory_total': gpu.memoryTotal,
@@ -135,131 +449,116 @@ class PlexTools:
                     'memory_free': gpu.memoryFree,
                     'temperature': gpu.temperature
                 })
-        except ImportError:
-            system_info['gpu_info'] = None
         except Exception as e:
-            logger.debug(f"Could not get GPU info: {e}")
-            system_info['gpu_info'] = None
+            logger.debug("Could not get GPU info: %s", e)
+            gpu_info = None
+
+        return {'gpu_info': gpu_info}
 
-        # System uptime
+    def _collect_uptime(self) -> dict:
+        """Collect the boot time and uptime."""
+        uptime_info = {}
         try:
             boot_time = psutil.boot_time()
-            system_info['boot_time'] = datetime.fromtimestamp(boot_time).strftime("%Y-%m-%d %H:%M:%S")
-            system_info['uptime_seconds'] = datetime.now().timestamp() - boot_time
-        except:
+            uptime_info['boot_time'] = datetime.fromtimestamp(boot_time).strftime("%Y-%m-%d %H:%M:%S")
+            uptime_info['uptime_seconds'] = datetime.now().timestamp() - boot_time
+        except (OSError, OverflowError, ValueError):
             pass
 
-        # Plex Server Info
+        return uptime_info
+
+    def _collect_plex_server(self) -> dict:
+        """Collect Plex server version and identity."""
+        server_info = {}
         try:
-            system_info['plex_version'] = self.plex.version
-            system_info['plex_platform'] = self.plex.platform
-            system_info['plex_platform_version'] = self.plex.platformVersion
-            system_info['plex_friendly_name'] = self.plex.friendlyName
-            system_info['plex_machine_identifier'] = self.plex.machineIdentifier
+            server_info['plex_version'] = self.plex.version
+            server_info['plex_platform'] = self.plex.platform
+            server_info['plex_platform_version'] = self.plex.platformVersion
+            server_info['plex_friendly_name'] = self.plex.friendlyName
+            server_info['plex_machine_identifier'] = self.plex.machineIdentifier
         except Exception as e:
-            logger.debug(f"Could not get Plex server info: {e}")
+            logger.debug("Could not get Plex server info: %s", e)
 
-        # Library Statistics
-        system_info['libraries'] = []
+        return server_info
+
+    def _collect_libraries(self) -> dict:
+        """
+        Collect item count and total size of each library.
+
+        The total size counts every media version and part of each item,
+        both when the server reports it and when it is added up locally.
+        """
+        libraries = []
         try:
-            for section in self.plex.library.sections():
+            storage = self._library_storage()
+            for section in self.get_sections():
                 lib_info = {
                     'name': section.title,
                     'type': section.type,
                 }
 
-                # Calculate total library size and item count
-                total_size = 0
-                items_count = 0
-
-                if section.type == 'movie':
-                    items = section.all()
-                    items_count = len(items)
-                    for item in items:
-                        try:
-                            if item.media and len(item.media) > 0:
-                                if item.media[0].parts and len(item.media[0].parts) > 0:
-                                    size_bytes = item.media[0].parts[0].size
-                                    if size_bytes:
-                                        total_size += size_bytes
-                        except:
-                            continue
-
-                elif section.type == 'show':
-                    # For TV shows, count episodes not shows
-                    shows = section.all()
-                    for show in shows:
-                        try:
-                            episodes = show.episodes()
-                            items_count += len(episodes)
-                            for episode in episodes:
-                                try:
-                                    if episode.media and len(episode.media) > 0:
-                                        if episode.media[0].parts and len(episode.media[0].parts) > 0:
-                                            size_bytes = episode.media[0].parts[0].size
-                                            if size_bytes:
-                                                total_size += size_bytes
-                                except:
-                                    continue
-                        except:
-                            continue
-
-                elif section.type == 'artist':
-                    # For music, count tracks not artists
-                    artists = section.all()
-                    for artist in artists:
-                        try:
-                            albums = artist.albums()
-                            for album in albums:
-                                try:
-                                    tracks = album.tracks()
-                                    items_count += len(tracks)
-                                    for track in tracks:
-                                        try:
-                                            if track.media and len(track.media) > 0:
-                                                if track.media[0].parts and len(track.media[0].parts) > 0:
-                                                    size_bytes = track.media[0].parts[0].size
-                                                    if size_bytes:
-                                                        total_size += size_bytes
-                                        except:
-                                            continue
-                                except:
-                                    continue
-                        except:
-                            continue
-                else:
-                    # For other types, just count items
-                    items = section.all()
-                    items_count = len(items)
-                    for item in items:
-                        try:
-                            if item.media and len(item.media) > 0:
-                                if item.media[0].parts and len(item.media[0].parts) > 0:
-                                    size_bytes = item.media[0].parts[0].size
-                                    if size_bytes:
-                                        total_size += size_bytes
-                        except:
-                            continue
+                # Let the server count and size the library; both are small
+                # requests regardless of the number of items
+                items_count = section.totalViewSize(libtype=LEAF_TYPES.get(section.type), includeCollections=False)
+                total_size = storage.get(str(section.key))
+                if items_count is None or total_size is None:
+                    # Older servers don't report storage, so add up the parts
+                    items_count, total_size = self._measure_section(section)
 
                 lib_info['items_count'] = items_count
                 lib_info['total_size'] = total_size
-                system_info['libraries'].append(lib_info)
+                libraries.append(lib_info)
         except Exception as e:
-            logger.debug(f"Could not get library info: {e}")
+            logger.debug("Could not get library info: %s", e)
 
-        return system_info
+        return {'libraries': libraries}
+
+    def _library_storage(self) -> dict:
+        """
+        Get the server-reported storage total of every library.
+
+        A single /media/providers request covers all libraries, where
+        LibrarySection.totalStorage would repeat it for each section.
+
+        Returns:
+            Dictionary of total size in bytes by section key; empty if the
+            server doesn't report storage
+        """
+        storage = {}
+        try:
+            data = self.plex.query('/media/providers?includeStorage=1')
+        except Exception as e:
+            logger.debug("Could not get library storage: %s", e)
+            return storage
+
+        xpath = './MediaProvider[@identifier="com.plexapp.plugins.library"]/Feature[@type="content"]/Directory'
+        for directory in data.findall(xpath):
+            total = directory.attrib.get('storageTotal')
+            if total is not None:
+                storage[directory.attrib.get('id')] = int(total)
+
+        return storage
+
+    def _measure_section(self, section) -> tuple:
+        """Count the items of a library section and add up their file sizes."""
+        total_size = 0
+        items_count = 0
+
+        # Count episodes/tracks rather than shows/artists
+        for item in self._iter_section(section, LEAF_TYPES.get(section.type), lean=True):
+            items_count += 1
+            try:
+                # Every version and part, as the server's storage total counts
+                for media in item.media:
+                    total_size += sum(part.size or 0 for part in media.parts)
+            except (AttributeError, TypeError):
+                continue
+
+        return items_count, total_size
 
     def print_system_info(self, system_info: dict):
         """Print formatted system information."""
 
-        def format_bytes(bytes_value):
-            """Convert bytes to human readable format."""
-            for unit in ['B', 'KB', 'MB', 'GB', 'TB', 'PB']:
-                if bytes_value < 1024.0:
-                    return f"{bytes_value:.2f} {unit}"
-                bytes_value /= 1024.0
-            return f"{bytes_value:.2f} PB"
-
         def format_seconds(seconds):
             """Convert seconds to human readable format."""
             days = int(seconds // 86400)
@@ -323,6 +622,7 @@ class PlexTools:
         print("=" * 80)
         print()
 
+    @cache_by_item
     def get_media_quality(self, item) -> dict:
         """Get video quality and codec information."""
         quality_info = {
@@ -338,20 +638,10 @@ class PlexTools:
                 media = item.media[0]
 
                 # Get resolution
-                if media.videoResolution:
-                    quality_info['resolution'] = media.videoResolution
-                elif media.width and media.height:
+                quality_info['resolution'] = _media_resolution(media)
+                if not media.videoResolution and media.width and media.height:
                     quality_info['width'] = media.width
                     quality_info['height'] = media.height
-                    # Determine resolution category
-                    if media.height >= 2160:
-                        quality_info['resolution'] = '4K'
-                    elif media.height >= 1080:
-                        quality_info['resolution'] = '1080p'
-                    elif media.height >= 720:
-                        quality_info['resolution'] = '720p'
-                    else:
-                        quality_info['resolution'] = 'SD'
 
                 # Get video codec
                 if media.videoCodec:
@@ -361,7 +651,7 @@ class PlexTools:
                 if media.audioCodec:
                     quality_info['audio_codec'] = media.audioCodec.upper()
         except Exception as e:
-            logger.debug(f"Could not get media quality: {e}")
+            logger.debug("Could not get media quality: %s", e)
 
         return quality_info
 
@@ -374,63 +664,53 @@ class PlexTools:
         }
 
         try:
-            watch_info['watched'] = item.isWatched if hasattr(item, 'isWatched') else False
-            watch_info['view_count'] = item.viewCount if hasattr(item, 'viewCount') else 0
+            watch_info['watched'] = getattr(item, 'isWatched', False)
+            watch_info['view_count'] = getattr(item, 'viewCount', 0)
 
-            if hasattr(item, 'lastViewedAt') and item.lastViewedAt:
-                watch_info['last_viewed_at'] = item.lastViewedAt.strftime("%Y-%m-%d %H:%M:%S")
+            # Kept as a datetime; it is only formatted when printed or exported
+            watch_info['last_viewed_at'] = getattr(item, 'lastViewedAt', None) or None
         except Exception as e:
-            logger.debug(f"Could not get watch info: {e}")
+            logger.debug("Could not get watch info: %s", e)
 
         return watch_info
 
     def analyze_library_quality(self, library_name: str) -> dict:
         """Analyze video quality and codec distribution in a library."""
         try:
-            library = self.plex.library.section(library_name)
+            library = self.get_section(library_name)
         except Exception as e:
             logger.error(f"Could not find library '{library_name}': {e}")
             return {}
 
         stats = {
-            'resolutions': {},
-            'video_codecs': {},
-            'audio_codecs': {},
+            'resolutions': Counter(),
+            'video_codecs': Counter(),
+            'audio_codecs': Counter(),
             'total_items': 0
         }
 
         # Get items
         items = []
-        if library.type == 'movie':
-            items = library.all()
-        elif library.type == 'show':
-            for show in library.all():
-                items.extend(show.episodes())
+        if library.type in ('movie', 'show'):
+            items = self._iter_section(library, LEAF_TYPES[library.type], lean=True)
 
-        logger.info(f"Analyzing {len(items)} items for quality metrics...")
+        logger.info("Analyzing items for quality metrics...")
 
-        for item in items:
+        # Listed items already carry their media details and do not reload,
+        # so there is no per-item I/O to overlap with a thread pool
+        for quality in map(self.get_media_quality, items):
             stats['total_items'] += 1
-            quality = self.get_media_quality(item)
-
-            # Count resolutions
-            res = quality['resolution']
-            stats['resolutions'][res] = stats['resolutions'].get(res, 0) + 1
 
-            # Count video codecs
-            vcodec = quality['video_codec']
-            stats['video_codecs'][vcodec] = stats['video_codecs'].get(vcodec, 0) + 1
-
-            # Count audio codecs
-            acodec = quality['audio_codec']
-            stats['audio_codecs'][acodec] = stats['audio_codecs'].get(acodec, 0) + 1
+            stats['resolutions'][quality['resolution']] += 1
+            stats['video_codecs'][quality['video_codec']] += 1
+            stats['audio_codecs'][quality['audio_codec']] += 1
 
         return stats
 
     def analyze_library_stats(self, library_name: str) -> dict:
         """Get general statistics for a library."""
         try:
-            library = self.plex.library.section(library_name)
+            library = self.get_section(library_name)
         except Exception as e:
             logger.error(f"Could not find library '{library_name}': {e}")
             return {}
@@ -441,82 +721,90 @@ class PlexTools:
             'watched_count': 0,
             'unwatched_count': 0,
             'total_duration': 0,
-            'by_year': {},
-            'by_genre': {},
-            'by_rating': {},
+            'by_year': Counter(),
+            'by_genre': Counter(),
+            'by_rating': Counter(),
         }
 
         # Get items
         items = []
-        if library.type == 'movie':
-            items = library.all()
-        elif library.type == 'show':
-            for show in library.all():
-                items.extend(show.episodes())
+        if library.type in ('movie', 'show'):
+            items = self._iter_section(library, LEAF_TYPES[library.type])
 
-        logger.info(f"Analyzing {len(items)} items for statistics...")
+        logger.info("Analyzing items for statistics...")
 
-        for item in items:
+        # Listed items carry every field read here and do not reload, so
+        # there is no per-item I/O to overlap with a thread pool
+        for result in map(self._analyze_one, items):
             stats['total_items'] += 1
-
-            # Size
-            filesize_bytes = 0
-            try:
-                if item.media and len(item.media) > 0:
-                    if item.media[0].parts and len(item.media[0].parts) > 0:
-                        filesize_bytes = item.media[0].parts[0].size or 0
-                        stats['total_size'] += filesize_bytes
-            except:
-                pass
+            stats['total_size'] += result['size']
 
             # Watch status
-            watch_info = self.get_watch_info(item)
-            if watch_info['watched']:
+            if result['watched']:
                 stats['watched_count'] += 1
             else:
                 stats['unwatched_count'] += 1
 
+            stats['total_duration'] += result['duration']
+
+            if result['year']:
+                stats['by_year'][result['year']] += 1
+
+            stats['by_genre'].update(result['genres'])
+
+            if result['rating']:
+                stats['by_rating'][result['rating']] += 1
+
+        return stats
+
+    def _analyze_one(self, item) -> dict:
+        """Collect the statistics fields of a single item."""
+        result = {
+            'size': 0,
+            'watched': False,
+            'duration': 0,
+            'year': None,
+            'genres': [],
+            'rating': None
+        }
+
+        # Size
+        try:
+            part = _first_part(item)
+            if part:
+                result['size'] = part.size or 0
+        except (AttributeError, IndexError, TypeError):
+            pass
+
+        # Watch status
+        result['watched'] = self.get_watch_info(item)['watched']
+
+        try:
             # Duration
-            try:
-                if hasattr(item, 'duration') and item.duration:
-                    stats['total_duration'] += item.duration
-            except:
-                pass
+            result['duration'] = getattr(item, 'duration', None) or 0
 
             # Year (for movies and shows)
-            try:
-                if hasattr(item, 'year') and item.year:
-                    year = str(item.year)
-                    stats['by_year'][year] = stats['by_year'].get(year, 0) + 1
-                elif hasattr(item, 'originallyAvailableAt') and item.originallyAvailableAt:
-                    year = str(item.originallyAvailableAt.year)
-                    stats['by_year'][year] = stats['by_year'].get(year, 0) + 1
-            except:
-                pass
-
-            # Genres
-            try:
-                if hasattr(item, 'genres'):
-                    for genre in item.genres:
-                        genre_name = genre.tag
-                        stats['by_genre'][genre_name] = stats['by_genre'].get(genre_name, 0) + 1
-            except:
-                pass
+            year = getattr(item, 'year', None)
+            released = getattr(item, 'originallyAvailableAt', None)
+            if year:
+                result['year'] = str(year)
+            elif released:
+                result['year'] = str(released.year)
 
             # Content rating
-            try:
-                if hasattr(item, 'contentRating') and item.contentRating:
-                    rating = item.contentRating
-                    stats['by_rating'][rating] = stats['by_rating'].get(rating, 0) + 1
-            except:
-                pass
+            result['rating'] = getattr(item, 'contentRating', None) or None
 
-        return stats
+            # Genres
+            result['genres'] = [genre.tag for genre in getattr(item, 'genres', [])]
+        except (AttributeError, TypeError):
+            pass
+
+        return result
 
     def check_library_health(self, library_name: str) -> dict:
         """Check library health and identify potential issues."""
         try:
-            library = self.plex.library.section(library_name)
+            library = self.get_section(library_name)
         except Exception as e:
             logger.error(f"Could not find library '{library_name}': {e}")
             return {}
@@ -532,121 +820,142 @@ class PlexTools:
 
         # Get items
         items = []
-        if library.type == 'movie':
-            items = library.all()
-        elif library.type == 'show':
-            for show in library.all():
-                items.extend(show.episodes())
+        if library.type in ('movie', 'show'):
+            items = self._iter_section(library, LEAF_TYPES[library.type], lean=True)
 
-        logger.info(f"Checking health for {len(items)} items...")
+        # Summary, year and subtitle streams need the full metadata
+        items = self._iter_full_items(items)
 
-        for item in items:
-            health['total_items'] += 1
+        logger.info("Checking health of items...")
 
-            item_name = item.title
-            if isinstance(item, Episode):
-                item_name = f"{item.grandparentTitle} - S{item.seasonNumber:02d}E{item.index:02d} - {item.title}"
+        # Items whose full metadata could not be batch fetched are reloaded
+        # for their streams, so checks still overlap on a bounded pool
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            for issues in imap_bounded(executor, self._check_one, items):
+                health['total_items'] += 1
+                for category, issue in issues.items():
+                    if issue:
+                        health[category].append(issue)
 
-            # Check for missing metadata
-            try:
-                if not item.summary or len(item.summary.strip()) < 10:
-                    health['missing_metadata'].append({
-                        'title': item_name,
-                        'issue': 'No summary',
-                        'rating_key': item.ratingKey
-                    })
-                elif not hasattr(item, 'year') or not item.year:
-                    health['missing_metadata'].append({
-                        'title': item_name,
-                        'issue': 'No year',
-                        'rating_key': item.ratingKey
-                    })
-            except:
-                pass
+        return health
 
-            # Check for low quality (SD only)
-            quality = self.get_media_quality(item)
-            if quality['resolution'] == 'SD':
-                health['low_quality'].append({
-                    'title': item_name,
-                    'resolution': quality['resolution'],
-                    'rating_key': item.ratingKey
-                })
+    def _check_one(self, item) -> dict:
+        """Check a single item and return the issue found for each health category."""
+        issues = {
+            'missing_metadata': None,
+            'low_quality': None,
+            'no_subtitles': None,
+            'very_large_files': None,
+            'never_watched': None,
+        }
 
-            # Check for missing subtitles
-            subtitle_info = self.get_subtitle_info(item)
-            if not subtitle_info['has_subtitles']:
-                health['no_subtitles'].append({
-                    'title': item_name,
-                    'rating_key': item.ratingKey
-                })
+        item_name = item.title
+        if isinstance(item, Episode):
+            item_name = f"{item.grandparentTitle} - S{item.seasonNumber:02d}E{item.index:02d} - {item.title}"
 
-            # Check for very large files (>50GB)
-            filesize_bytes = 0
-            try:
-                if item.media and len(item.media) > 0:
-                    if item.media[0].parts and len(item.media[0].parts) > 0:
-                        filesize_bytes = item.media[0].parts[0].size or 0
-                        if filesize_bytes > 50 * 1024 * 1024 * 1024:  # 50GB
-                            health['very_large_files'].append({
-                                'title': item_name,
-                                'size': filesize_bytes,
-                                'rating_key': item.ratingKey
-                            })
-            except:
-                pass
+        scan = self._scan_item(item)
+        rating_key = item.ratingKey
 
-            # Check for never watched items
-            watch_info = self.get_watch_info(item)
-            if watch_info['view_count'] == 0:
-                health['never_watched'].append({
-                    'title': item_name,
-                    'rating_key': item.ratingKey
-                })
+        # Check for missing metadata
+        if scan['summary_len'] < 10:
+            issues['missing_metadata'] = {
+                'title': item_name,
+                'issue': 'No summary',
+                'rating_key': rating_key
+            }
+        elif not scan['year']:
+            issues['missing_metadata'] = {
+                'title': item_name,
+                'issue': 'No year',
+                'rating_key': rating_key
+            }
 
-        return health
+        # Check for low quality (SD only)
+        if scan['resolution'] == 'SD':
+            issues['low_quality'] = {
+                'title': item_name,
+                'resolution': scan['resolution'],
+                'rating_key': rating_key
+            }
+
+        # Check for missing subtitles
+        if not scan['has_subtitles']:
+            issues['no_subtitles'] = {
+                'title': item_name,
+                'rating_key': rating_key
+            }
+
+        # Check for very large files (>50GB)
+        if scan['size'] > 50 * 1024 * 1024 * 1024:
+            issues['very_large_files'] = {
+                'title': item_name,
+                'size': scan['size'],
+                'rating_key': rating_key
+            }
+
+        # Check for never watched items
+        if scan['view_count'] == 0:
+            issues['never_watched'] = {
+                'title': item_name,
+                'rating_key': rating_key
+            }
+
+        return issues
+
+    def _scan_item(self, item) -> dict:
+        """Read everything the health checks need from an item in one pass."""
+        scan = {
+            'resolution': 'Unknown',
+            'size': 0,
+            'has_subtitles': False,
+            'summary_len': 0,
+            'year': None,
+            'view_count': 0
+        }
 
-    def get_filepath(self, item) -> str:
-        """Get the file path for an item."""
         try:
-            if item.media and len(item.media) > 0:
-                if item.media[0].parts and len(item.media[0].parts) > 0:
-                    filepath = item.media[0].parts[0].file
-                    if filepath:
-                        return filepath
-        except Exception as e:
-            logger.debug(f"Could not get filepath: {e}")
-        return "Unknown"
+            media = item.media[0] if item.media else None
+            part = media.parts[0] if media and media.parts else None
+            if media:
+                scan['resolution'] = _media_resolution(media)
+            if part:
+                scan['size'] = part.size or 0
+        except (AttributeError, IndexError, TypeError):
+            pass
+
+        summary = getattr(item, 'summary', None)
+        if summary:
+            scan['summary_len'] = len(summary.strip())
+        scan['year'] = getattr(item, 'year', None)
+        scan['view_count'] = getattr(item, 'viewCount', 0) or 0
+
+        # Streams are already loaded on full items, so this reads the parts
+        scan['has_subtitles'] = self.get_subtitle_info(item)['has_subtitles']
+
+        return scan
 
     def get_filepath(self, item) -> str:
         """Get the file path for an item."""
         try:
-            if item.media and len(item.media) > 0:
-                if item.media[0].parts and len(item.media[0].parts) > 0:
-                    filepath = item.media[0].parts[0].file
-                    if filepath:
-                        return filepath
+            part = _first_part(item)
+            if part and part.file:
+                return part.file
         except Exception as e:
-            logger.debug(f"Could not get filepath: {e}")
+            logger.debug("Could not get filepath: %s", e)
         return "Unknown"
 
     def get_filesize(self, item) -> str:
         """Get human-readable file size for an item."""
         try:
             # Get the first media part (usually there's only one)
-            if item.media and len(item.media) > 0:
-                if item.media[0].parts and len(item.media[0].parts) > 0:
-                    size_bytes = item.media[0].parts[0].size
-                    if size_bytes:
-                        # Convert to human readable
-                        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-                            if size_bytes < 1024.0:
-                                return f"{size_bytes:.2f} {unit}"
-                            size_bytes /= 1024.0
+            part = _first_part(item)
+            if part and part.size:
+                return format_bytes(part.size)
         except Exception as e:
-            logger.debug(f"Could not get filesize: {e}")
+            logger.debug("Could not get filesize: %s", e)
         return "Unknown"
 
+    @cache_by_item
     def get_subtitle_info(self, item) -> dict:
         """Get detailed subtitle information for an item."""
         subtitle_info = {
@@ -656,7 +965,20 @@ class PlexTools:
             'streams': []
         }
 
-        for stream in item.subtitleStreams():
+        # Read the streams from the already loaded parts. Library listings
+        # don't include stream details, so listing items are reloaded once
+        # without the extra includes item.subtitleStreams() would request.
+        # Full items without streams (e.g. unanalyzed media) are not.
+        if not getattr(item, '_fullMetadata', False) and item.isPartialObject():
+            item.reload(**LEAN_RELOAD)
+        parts = list(item.iterParts())
+
+        streams = [stream for part in parts for stream in part.subtitleStreams()]
+
+        # Insertion-ordered set of language codes
+        languages = {}
+
+        for stream in streams:
             subtitle_info['has_subtitles'] = True
             subtitle_info['count'] += 1
 
@@ -665,214 +987,192 @@ class PlexTools:
             lang_name = stream.language if stream.language else 'Unknown'
 
             # Normalize language code
-            if lang_code and len(lang_code) == 3:
-                conversions = {'eng': 'en', 'spa': 'es', 'fra': 'fr', 'deu': 'de', 'ita': 'it', 'por': 'pt'}
-                lang_code = conversions.get(lang_code.lower(), lang_code[:2])
-            elif lang_code:
+            if len(lang_code) == 3:
+                lang_code = LANG3_TO_2.get(lang_code.lower(), lang_code[:2])
+            elif not lang_code.islower():
                 lang_code = lang_code.lower()
 
-            if lang_code not in subtitle_info['languages']:
-                subtitle_info['languages'].append(lang_code)
+            languages[lang_code] = None
 
             subtitle_info['streams'].append({
                 'language': lang_name,
                 'language_code': lang_code,
-                'title': stream.title if hasattr(stream, 'title') and stream.title else None,
-                'format': stream.codec if hasattr(stream, 'codec') else stream.format if hasattr(stream,
-                                                                                                 'format') else 'srt',
-                'forced': stream.forced if hasattr(stream, 'forced') else False,
+                'title': getattr(stream, 'title', None) or None,
+                'format': getattr(stream, 'codec', getattr(stream, 'format', 'srt')),
+                'forced': getattr(stream, 'forced', False),
                 'external': getattr(stream, 'external', False)
             })
 
+        subtitle_info['languages'] = list(languages)
         return subtitle_info
 
-    def list_library(self, library_name: str, media_type: str = None):
+    def list_library(self, library_name: str, media_type: str = None, missing_only: bool = False) -> list:
         """
         List all items in library with subtitle details.
 
         Args:
             library_name: Library name to scan
             media_type: Filter by 'movie' or 'episode'
+            missing_only: Only include items without subtitles
 
         Returns:
             List of items with subtitle info
         """
+        return list(self.iter_library(library_name, media_type, missing_only))
+
+    def iter_library(self, library_name: str, media_type: str = None, missing_only: bool = False):
+        """
+        Iterate over all items in library with subtitle details.
+
+        Items are yielded as they are scanned, so callers that handle one
+        item at a time never hold the whole library in memory.
+
+        Args:
+            library_name: Library name to scan
+            media_type: Filter by 'movie' or 'episode'
+            missing_only: Only yield items without subtitles
+
+        Yields:
+            Item with subtitle info
+        """
         try:
-            library = self.plex.library.section(library_name)
+            library = self.get_section(library_name)
         except Exception as e:
             logger.error(f"Could not find library '{library_name}': {e}")
-            return []
+            return
 
         logger.info(f"\nScanning library: {library_name}")
         logger.info(f"{'=' * 60}")
 
-        # Get items
-        items = []
+        # Get items - episodes and tracks straight from the section, or
+        # whatever the section holds for other library types
         if media_type == 'movie' or library.type == 'movie':
-            items = library.all()
-        elif media_type == 'episode' or library.type == 'show':
-            for show in library.all():
-                for episode in show.episodes():
-                    items.append(episode)
-        elif library.type == 'artist':
-            # Music library - get all tracks
-            for artist in library.all():
-                for album in artist.albums():
-                    for track in album.tracks():
-                        items.append(track)
+            type_num = LEAF_TYPES['movie']
+        elif media_type == 'episode':
+            type_num = LEAF_TYPES['show']
         else:
-            # Other library types - try to get all items
-            items = library.all()
-
-        logger.info(f"Scanning {len(items)} items...")
-
-        library_items = []
-
-        for item in items:
-            subtitle_info = self.get_subtitle_info(item)
-            filepath = self.get_filepath(item)
-            filesize = self.get_filesize(item)
-            quality_info = self.get_media_quality(item)
-            watch_info = self.get_watch_info(item)
-
-            item_name = item.title
-            item_type = 'other'
-
-            if isinstance(item, Episode):
-                item_name = f"{item.grandparentTitle} - S{item.seasonNumber:02d}E{item.index:02d} - {item.title}"
-                item_type = 'episode'
-            elif library.type == 'movie':
-                item_type = 'movie'
-            elif library.type == 'artist':
-                # Music track - show artist - album - title
-                try:
-                    item_name = f"{item.grandparentTitle} - {item.parentTitle} - {item.title}"
-                    item_type = 'track'
-                except:
-                    pass
-
-            plex_url = f"{self.plex._baseurl}/web/index.html#!/server/{self.plex.machineIdentifier}/details?key=/library/metadata/{item.ratingKey}"
-
-            library_items.append({
-                'title': item_name,
-                'type': item_type,
-                'url': plex_url,
-                'rating_key': item.ratingKey,
-                'filepath': filepath,
-                'filesize': filesize,
-                'resolution': quality_info['resolution'],
-                'video_codec': quality_info['video_codec'],
-                'audio_codec': quality_info['audio_codec'],
-                'watched': watch_info['watched'],
-                'view_count': watch_info['view_count'],
-                'last_viewed': watch_info['last_viewed_at'],
-                'has_subtitles': subtitle_info['has_subtitles'],
-                'languages': subtitle_info['languages'],
-                'subtitle_streams': subtitle_info['streams']
-            })
-
-        return library_items
+            type_num = LEAF_TYPES.get(library.type)
+        items = self._iter_section(library, type_num, lean=True)
+
+        # Subtitle streams need the full metadata
+        items = self._iter_full_items(items)
+
+        logger.info("Scanning items...")
+
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            for entry in imap_bounded(executor, lambda item: self._build_library_item(item, library.type), items):
+                if missing_only and entry['has_subtitles']:
+                    continue
+                yield entry
+
+    def _build_library_item(self, item, library_type: str) -> dict:
+        """Collect the listing details of a single item."""
+        subtitle_info = self.get_subtitle_info(item)
+        filepath = self.get_filepath(item)
+        filesize = self.get_filesize(item)
+        quality_info = self.get_media_quality(item)
+        watch_info = self.get_watch_info(item)
+
+        item_name = item.title
+        item_type = 'other'
+        show_name = None
+
+        if isinstance(item, Episode):
+            item_name = f"{item.grandparentTitle} - S{item.seasonNumber:02d}E{item.index:02d} - {item.title}"
+            item_type = 'episode'
+            show_name = item_name.split(' - ', 1)[0]
+        elif library_type == 'movie':
+            item_type = 'movie'
+        elif library_type == 'artist':
+            # Music track - show artist - album - title
+            try:
+                item_name = f"{item.grandparentTitle} - {item.parentTitle} - {item.title}"
+                item_type = 'track'
+            except AttributeError:
+                pass
 
-    def print_library_list(self, library_items: list):
-        """Print formatted list of library items with subtitle details."""
-        print("\n" + "=" * 80)
-        print("LIBRARY ITEMS WITH SUBTITLE DETAILS")
-        print("=" * 80)
-        print(f"Total items: {len(library_items)}")
+        plex_url = f"{self.plex._baseurl}/web/index.html#!/server/{self.plex.machineIdentifier}/details?key=/library/metadata/{item.ratingKey}"
+
+        return {
+            'title': item_name,
+            'type': item_type,
+            'show_name': show_name,
+            'url': plex_url,
+            'rating_key': item.ratingKey,
+            'filepath': filepath,
+            'filesize': filesize,
+            'resolution': quality_info['resolution'],
+            'video_codec': quality_info['video_codec'],
+            'audio_codec': quality_info['audio_codec'],
+            'watched': watch_info['watched'],
+            'view_count': watch_info['view_count'],
+            'last_viewed': watch_info['last_viewed_at'],
+            'has_subtitles': subtitle_info['has_subtitles'],
+            'languages': subtitle_info['languages'],
+            'subtitle_streams': subtitle_info['streams']
+        }
 
-        # Count items with/without subtitles
-        with_subs = len([item for item in library_items if item['has_subtitles']])
+    def library_report_lines(self, library_items: list) -> list:
+        """Build the formatted list of library items as a list of lines."""
+        buf = []
+        append = buf.append
+
+        append("\n" + "=" * 80 + "\n")
+        append("LIBRARY ITEMS WITH SUBTITLE DETAILS\n")
+        append("=" * 80 + "\n")
+        append(f"Total items: {len(library_items)}\n")
+
+        # Split by type and count items with/without subtitles in one pass
+        movies, episodes = [], []
+        with_subs = 0
+        for item in library_items:
+            if item['has_subtitles']:
+                with_subs += 1
+            item_type = item['type']
+            if item_type == 'movie':
+                movies.append(item)
+            elif item_type == 'episode':
+                episodes.append(item)
         without_subs = len(library_items) - with_subs
 
-        print(f"Items with subtitles: {with_subs}")
-        print(f"Items without subtitles: {without_subs}")
-        print("=" * 80)
-
-        movies = [item for item in library_items if item['type'] == 'movie']
-        episodes = [item for item in library_items if item['type'] == 'episode']
+        append(f"Items with subtitles: {with_subs}\n")
+        append(f"Items without subtitles: {without_subs}\n")
+        append("=" * 80 + "\n")
 
         if movies:
-            print(f"\nMOVIES ({len(movies)} items)")
-            print("-" * 80)
+            append(f"\nMOVIES ({len(movies)} items)\n")
+            append("-" * 80 + "\n")
             for idx, item in enumerate(movies, 1):
-                print(f"\n{idx}. {item['title']}")
-                print(f"   Rating Key: {item['rating_key']}")
-                print(f"   File Path: {item['filepath']}")
-                print(f"   URL: {item['url']}")
-                print(f"   File Size: {item['filesize']}")
-                print(f"   Quality: {item['resolution']} | Video: {item['video_codec']} | Audio: {item['audio_codec']}")
-                print(f"   Watched: {'✓ Yes' if item['watched'] else '✗ No'} (Views: {item['view_count']})")
-                if item['last_viewed']:
-                    print(f"   Last Viewed: {item['last_viewed']}")
-
-                if item['has_subtitles']:
-                    print(f"   Subtitles: YES")
-                    print(
-                        f"   Languages: {', '.join(set(item['languages'])).upper() if item['languages'] else 'Unknown'}")
-                    print(f"   Streams:")
-                    for stream in item['subtitle_streams']:
-                        forced = " [FORCED]" if stream['forced'] else ""
-                        title = f" - {stream['title']}" if stream['title'] else ""
-                        external = " [EXTERNAL]" if stream['external'] else " [EMBEDDED]"
-                        print(
-                            f"     • {stream['language']} ({stream['language_code'].upper()}) - {stream['format']}{title}{forced}{external}")
-                else:
-                    print(f"   Subtitles: NO")
+                append(f"\n{idx}. {item['title']}\n")
+                _format_item(item, 3, append, show_last_viewed=True)
 
         if episodes:
-            print(f"\n\nTV EPISODES ({len(episodes)} items)")
-            print("-" * 80)
-
-            # Group by show
-            shows = {}
-            for ep in episodes:
-                show_name = ep['title'].split(' - ')[0]
-                if show_name not in shows:
-                    shows[show_name] = []
-                shows[show_name].append(ep)
-
-            for show_name, eps in sorted(shows.items()):
-                print(f"\n{show_name} ({len(eps)} episodes)")
-                for ep in sorted(eps, key=lambda x: x['title']):
-                    print(f"\n  {ep['title']}")
-                    print(f"    Rating Key: {ep['rating_key']}")
-                    print(f"    File Path: {ep['filepath']}")
-                    print(f"    URL: {ep['url']}")
-                    print(f"    File Size: {ep['filesize']}")
-                    print(f"    Quality: {ep['resolution']} | Video: {ep['video_codec']} | Audio: {ep['audio_codec']}")
-                    print(f"    Watched: {'✓ Yes' if ep['watched'] else '✗ No'} (Views: {ep['view_count']})")
-
-                    if ep['has_subtitles']:
-                        print(f"    Subtitles: YES")
-                        print(
-                            f"    Languages: {', '.join(set(ep['languages'])).upper() if ep['languages'] else 'Unknown'}")
-                        print(f"    Streams:")
-                        for stream in ep['subtitle_streams']:
-                            forced = " [FORCED]" if stream['forced'] else ""
-                            title = f" - {stream['title']}" if stream['title'] else ""
-                            external = " [EXTERNAL]" if stream['external'] else " [EMBEDDED]"
-                            print(
-                                f"      • {stream['language']} ({stream['language_code'].upper()}) - {stream['format']}{title}{forced}{external}")
-                    else:
-                        print(f"    Subtitles: NO")
+            append(f"\n\nTV EPISODES ({len(episodes)} items)\n")
+            append("-" * 80 + "\n")
 
-        print("\n" + "=" * 80)
-        print()
+            # Sort by show and title once, then walk each show's run in order
+            episodes.sort(key=itemgetter('show_name', 'title'))
+            for show_name, eps in groupby(episodes, key=itemgetter('show_name')):
+                eps = list(eps)
+                append(f"\n{show_name} ({len(eps)} episodes)\n")
+                for ep in eps:
+                    append(f"\n  {ep['title']}\n")
+                    _format_item(ep, 4, append)
 
-    def save_library_report(self, library_items: list, output_file: str = "library_subtitles.txt"):
-        """Save the library report to a file."""
-        import io
-        from contextlib import redirect_stdout
+        append("\n" + "=" * 80 + "\n")
+        append("\n")
 
-        # Capture print output
-        f = io.StringIO()
-        with redirect_stdout(f):
-            self.print_library_list(library_items)
+        return buf
 
-        report = f.getvalue()
+    def save_library_report(self, lines: list, output_file: str = "library_subtitles.txt"):
+        """
+        Save library report lines to a file.
 
-        with open(output_file, 'w', encoding='utf-8') as file:
-            file.write(report)
+        The lines are written through the file buffer as they are, without
+        joining them into one string first.
+        """
+        with open(output_file, 'w', buffering=1 << 20, encoding='utf-8') as file:
+            file.writelines(lines)
 
         logger.info(f"Report saved to: {output_file}")
 
@@ -999,7 +1299,7 @@ For more information, see the README.md file.
             }
 
             # Get all libraries
-            for section in tools.plex.library.sections():
+            for section in tools.get_sections():
                 logger.info(f"Processing library: {section.title}")
 
                 library_data = {
@@ -1023,8 +1323,16 @@ For more information, see the README.md file.
             with open(template_path, 'r', encoding='utf-8') as f:
                 html_template = f.read()
 
-            # Embed the JSON data into the HTML
-            json_data = json.dumps(export_data, indent=2, ensure_ascii=False)
+            # Embed the JSON data into the HTML, using orjson when it is installed
+            try:
+                import orjson
+                json_data = orjson.dumps(
+                    export_data,
+                    default=format_datetime,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME
+                ).decode('utf-8')
+            except ImportError:
+                json_data = json.dumps(export_data, indent=2, ensure_ascii=False, default=format_datetime)
 
             # Replace the loadData function to use embedded data instead of fetch
             html_with_data = html_template.replace(
@@ -1098,7 +1406,6 @@ For more information, see the README.md file.
             # Open in browser (handle WSL2)
             import webbrowser
             import subprocess
-            import platform
 
             file_path = os.path.abspath(output_file)
 
@@ -1119,7 +1426,7 @@ For more information, see the README.md file.
                         # Open with Windows default browser
                         subprocess.run(['cmd.exe', '/c', 'start', windows_path], stderr=subprocess.DEVNULL)
                         return
-            except:
+            except (OSError, IndexError):
                 pass
 
             # Not WSL2 or conversion failed - use normal method
@@ -1149,26 +1456,27 @@ For more information, see the README.md file.
 
             print(f"\nTotal Items: {quality_stats['total_items']:,}")
 
+            # Scale factor from count to percentage of all items
+            total = quality_stats['total_items']
+            inv = 100.0 / total if total else 0.0
+
             print("\n" + "-" * 80)
             print("RESOLUTION DISTRIBUTION")
             print("-" * 80)
-            for res, count in sorted(quality_stats['resolutions'].items(), key=lambda x: x[1], reverse=True):
-                percentage = (count / quality_stats['total_items'] * 100) if quality_stats['total_items'] > 0 else 0
-                print(f"{res:15s}: {count:5,} ({percentage:5.1f}%)")
+            for res, count in sorted(quality_stats['resolutions'].items(), key=itemgetter(1), reverse=True):
+                print(f"{res:15s}: {count:5,} ({count * inv:5.1f}%)")
 
             print("\n" + "-" * 80)
             print("VIDEO CODEC DISTRIBUTION")
             print("-" * 80)
-            for codec, count in sorted(quality_stats['video_codecs'].items(), key=lambda x: x[1], reverse=True):
-                percentage = (count / quality_stats['total_items'] * 100) if quality_stats['total_items'] > 0 else 0
-                print(f"{codec:15s}: {count:5,} ({percentage:5.1f}%)")
+            for codec, count in sorted(quality_stats['video_codecs'].items(), key=itemgetter(1), reverse=True):
+                print(f"{codec:15s}: {count:5,} ({count * inv:5.1f}%)")
 
             print("\n" + "-" * 80)
             print("AUDIO CODEC DISTRIBUTION")
             print("-" * 80)
-            for codec, count in sorted(quality_stats['audio_codecs'].items(), key=lambda x: x[1], reverse=True):
-                percentage = (count / quality_stats['total_items'] * 100) if quality_stats['total_items'] > 0 else 0
-                print(f"{codec:15s}: {count:5,} ({percentage:5.1f}%)")
+            for codec, count in sorted(quality_stats['audio_codecs'].items(), key=itemgetter(1), reverse=True):
+                print(f"{codec:15s}: {count:5,} ({count * inv:5.1f}%)")
 
             print("\n" + "=" * 80)
             print()
@@ -1183,13 +1491,6 @@ For more information, see the README.md file.
             logger.info(f"Gathering statistics for library: {args.library}")
             stats = tools.analyze_library_stats(args.library)
 
-            def format_bytes(bytes_value):
-                for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-                    if bytes_value < 1024.0:
-                        return f"{bytes_value:.2f} {unit}"
-                    bytes_value /= 1024.0
-                return f"{bytes_value:.2f} TB"
-
             def format_duration(ms):
                 seconds = ms / 1000
                 hours = int(seconds // 3600)
@@ -1205,30 +1506,29 @@ For more information, see the README.md file.
             if stats['total_duration'] > 0:
                 print(f"Total Runtime: {format_duration(stats['total_duration'])}")
 
-            print(
-                f"\nWatched: {stats['watched_count']:,} ({(stats['watched_count'] / stats['total_items'] * 100 if stats['total_items'] > 0 else 0):.1f}%)")
-            print(
-                f"Unwatched: {stats['unwatched_count']:,} ({(stats['unwatched_count'] / stats['total_items'] * 100 if stats['total_items'] > 0 else 0):.1f}%)")
+            inv = 100.0 / stats['total_items'] if stats['total_items'] else 0.0
+            print(f"\nWatched: {stats['watched_count']:,} ({stats['watched_count'] * inv:.1f}%)")
+            print(f"Unwatched: {stats['unwatched_count']:,} ({stats['unwatched_count'] * inv:.1f}%)")
 
             if stats['by_year']:
                 print("\n" + "-" * 80)
                 print("BY YEAR (Top 10)")
                 print("-" * 80)
-                for year, count in sorted(stats['by_year'].items(), key=lambda x: x[1], reverse=True)[:10]:
+                for year, count in sorted(stats['by_year'].items(), key=itemgetter(1), reverse=True)[:10]:
                     print(f"{year}: {count:,}")
 
             if stats['by_genre']:
                 print("\n" + "-" * 80)
                 print("BY GENRE (Top 10)")
                 print("-" * 80)
-                for genre, count in sorted(stats['by_genre'].items(), key=lambda x: x[1], reverse=True)[:10]:
+                for genre, count in sorted(stats['by_genre'].items(), key=itemgetter(1), reverse=True)[:10]:
                     print(f"{genre:25s}: {count:,}")
 
             if stats['by_rating']:
                 print("\n" + "-" * 80)
                 print("BY CONTENT RATING")
                 print("-" * 80)
-                for rating, count in sorted(stats['by_rating'].items(), key=lambda x: x[1], reverse=True):
+                for rating, count in sorted(stats['by_rating'].items(), key=itemgetter(1), reverse=True):
                     print(f"{rating:15s}: {count:,}")
 
             print("\n" + "=" * 80)
@@ -1244,13 +1544,6 @@ For more information, see the README.md file.
             logger.info(f"Checking health for library: {args.library}")
             health = tools.check_library_health(args.library)
 
-            def format_bytes(bytes_value):
-                for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-                    if bytes_value < 1024.0:
-                        return f"{bytes_value:.2f} {unit}"
-                    bytes_value /= 1024.0
-                return f"{bytes_value:.2f} TB"
-
             print("\n" + "=" * 80)
             print(f"LIBRARY HEALTH CHECK - {args.library}")
             print("=" * 80)
@@ -1322,11 +1615,16 @@ For more information, see the README.md file.
             print("AVAILABLE PLEX LIBRARIES")
             print("=" * 80)
 
-            sections = tools.plex.library.sections()
+            sections = tools.get_sections()
             for section in sections:
+                # Let the server count the items instead of fetching them all
+                try:
+                    item_count = section.totalSize
+                except AttributeError:
+                    item_count = len(section.all())
                 print(f"\n{section.title}")
                 print(f"  Type: {section.type}")
-                print(f"  Items: {len(section.all())}")
+                print(f"  Items: {item_count}")
 
             print("\n" + "=" * 80)
             print("\nTo analyze a library, run:")
@@ -1341,21 +1639,18 @@ For more information, see the README.md file.
         # Get library items with subtitle details
         library_items = tools.list_library(
             library_name=args.library,
-            media_type=args.type
+            media_type=args.type,
+            missing_only=args.list_missing
         )
 
-        # Filter for missing only if requested
-        if args.list_missing:
-            library_items = [item for item in library_items if not item['has_subtitles']]
-            if not library_items:
-                print("\n✓ All items in the library have subtitles!\n")
-                return
-
-        # Print to console
-        tools.print_library_list(library_items)
+        if args.list_missing and not library_items:
+            print("\n✓ All items in the library have subtitles!\n")
+            return
 
-        # Save to file
-        tools.save_library_report(library_items, args.output)
+        # Format once, then print to console and save to file
+        lines = tools.library_report_lines(library_items)
+        sys.stdout.write(''.join(lines))
+        tools.save_library_report(lines, args.output)
 
     except KeyboardInterrupt:
         logger.info("\nInterrupted by user")